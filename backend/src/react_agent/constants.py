@@ -0,0 +1,126 @@
+"""Constants shared across the agent."""
+
+# Tool names by service (tool type)
+SERVICE_METHODS: dict[str, frozenset[str]] = {
+    "x": frozenset(
+        {
+            "X_DeleteTweetById",
+            "X_LookupSingleUserByUsername",
+            "X_LookupTweetById",
+            "X_PostTweet",
+            "X_SearchRecentTweetsByKeywords",
+            "X_SearchRecentTweetsByUsername",
+        }
+    ),
+    "github": frozenset(
+        {
+            "Github_CountStargazers",
+            "Github_CreateIssue",
+            "Github_CreateIssueComment",
+            "Github_CreateReplyForReviewComment",
+            "Github_CreateReviewComment",
+            "Github_GetPullRequest",
+            "Github_GetRepository",
+            "Github_ListOrgRepositories",
+            "Github_ListPullRequestCommits",
+            "Github_ListPullRequests",
+            "Github_ListRepositoryActivities",
+            "Github_ListReviewCommentsInARepository",
+            "Github_ListReviewCommentsOnPullRequest",
+            "Github_ListStargazers",
+            "Github_SetStarred",
+            "Github_UpdatePullRequest",
+        }
+    ),
+    "gmail": frozenset(
+        {
+            "Google_ListDraftEmails",
+            "Google_ListEmails",
+            "Google_ReplyToEmail",
+            "Google_SendEmail",
+            "Google_SendDraftEmail",
+            "Google_WriteDraftEmail",
+            "Google_WriteDraftReplyEmail",
+            "Google_SearchContactsByEmail",
+            "Google_SearchContactsByName",
+        }
+    ),
+    "google": frozenset(
+        {
+            "Google_ChangeEmailLabels",
+            "Google_CreateContact",
+            "Google_CreateLabel",
+            "Google_DeleteDraftEmail",
+            "Google_GetThread",
+            "Google_ListEmailsByHeader",
+            "Google_ListLabels",
+            "Google_ListThreads",
+            "Google_SearchContactsByEmail",
+            "Google_SearchContactsByName",
+            "Google_SearchThreads",
+            "Google_TrashEmail",
+            "Google_UpdateDraftEmail",
+        }
+    ),
+    "gcal": frozenset(
+        {
+            "Google_SearchContactsByEmail",
+            "Google_SearchContactsByName",
+            "Google_CreateEvent",
+            "Google_ListEvents",
+            "Google_UpdateEvent",
+            "Google_DeleteEvent",
+        }
+    ),
+    "linkedin": frozenset(
+        {
+            "Linkedin_CreateTextPost",
+        }
+    ),
+    "search": frozenset(
+        {
+            "Search_SearchGoogle",
+        }
+    ),
+    "hotels": frozenset(
+        {
+            "Search_SearchHotels",
+        }
+    ),
+    "flights": frozenset(
+        {
+            "Search_SearchOneWayFlights",
+            "Search_SearchRoundTripFlights",
+        }
+    ),
+    "stocks": frozenset(
+        {
+            "Search_StockSummary",
+            "Search_StockHistoricalData",
+        }
+    ),
+    "codesandbox": frozenset(
+        {
+            "CodeSandbox_RunCode",
+        }
+    ),
+}
+
+# Read-only tools whose results can be briefly reused for identical calls.
+# Tools that change state (sending email, posting, creating issues, ...)
+# must never be listed here.
+CACHEABLE_TOOLS: frozenset[str] = frozenset(
+    {
+        "Github_CountStargazers",
+        "Github_GetRepository",
+        "Github_ListOrgRepositories",
+        "Github_ListStargazers",
+        "Google_ListLabels",
+        "Google_SearchContactsByEmail",
+        "Google_SearchContactsByName",
+        "Search_SearchGoogle",
+        "Search_StockHistoricalData",
+        "X_LookupSingleUserByUsername",
+        "X_LookupTweetById",
+    }
+)
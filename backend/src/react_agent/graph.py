@@ -1,54 +1,56 @@
-from typing import Optional, TypedDict
+from functools import lru_cache
 
+from langchain_core.messages import AnyMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import ToolNode, create_react_agent
+from langgraph.prebuilt.chat_agent_executor import AgentState
 
-from react_agent.prompts import SYSTEM_PROMPT
+from react_agent.prompts import CURRENT_TIMES_PROMPT, SYSTEM_PROMPT
 from react_agent.tools import get_tools
 from react_agent.utils import get_formatted_times, load_chat_model
 
+# Loaded at import so the model client is ready before the first request.
+# Change the model here.
+_MODEL = load_chat_model("openai/o3-mini")
 
-class HumanInterruptConfig(TypedDict):
-    """Settings for the human interrupt."""
 
-    allow_ignore: bool
-    allow_respond: bool
-    allow_edit: bool
-    allow_accept: bool
+def _prompt(state: AgentState) -> list[AnyMessage]:
+    """Wrap the conversation with the static system prompt and current times.
 
+    The times go in a trailing message so the cached prompt prefix is unchanged.
+    """
+    times = CURRENT_TIMES_PROMPT.format(current_times=get_formatted_times())
+    return [
+        SystemMessage(content=SYSTEM_PROMPT),
+        *state["messages"],
+        SystemMessage(content=times),
+    ]
 
-class ActionRequest(TypedDict):
-    """Action request from the agent."""
 
-    action: str
-    args: dict
+@lru_cache(maxsize=64)
+def _build_graph(tool_types: frozenset[str]) -> CompiledStateGraph:
+    """Build the agent graph for a set of tool types, with caching.
 
+    Building the agent is the expensive part of `make_graph`, and the config
+    only varies by tool types. The cache is bounded since the tool types come
+    from the client.
+    """
+    # Get the tools filtered by allowed types
+    allowed_tools = get_tools(list(tool_types))
 
-class HumanInterrupt(TypedDict):
-    """Interrupt the agent with a human action request."""
+    tool_node = ToolNode(tools=allowed_tools)
 
-    action_request: ActionRequest
-    config: HumanInterruptConfig
-    description: Optional[str]
+    # The times message is rendered on each model call (rather than once here)
+    # so the cached graph keeps reporting fresh times.
+    graph = create_react_agent(_MODEL, tools=tool_node, prompt=_prompt)
+    graph.name = "ReAct Agent"  # This customizes the name in LangSmith
+    return graph
 
 
 async def make_graph(config: RunnableConfig) -> CompiledStateGraph:
     """Create a custom state graph for the Reasoning and Action agent."""
-    # Initialize the model with tool binding. Change the model or add more tools here.
-    model = load_chat_model("openai/o3-mini")
-
-    # Format the system prompt. Customize this to change the agent's behavior.
-    prompt = SYSTEM_PROMPT.format(current_times=get_formatted_times())
-
     # Get allowed tool types from config
     tool_types = config.get("configurable", {}).get("tools", [])
 
-    # Get the tools filtered by allowed types
-    allowed_tools = get_tools(tool_types)
-
-    tool_node = ToolNode(tools=allowed_tools)
-
-    graph = create_react_agent(model, tools=tool_node, prompt=prompt)
-    graph.name = "ReAct Agent"  # This customizes the name in LangSmith
-    return graph
+    return _build_graph(frozenset(tool_types or ()))
@@ -0,0 +1,27 @@
+"""Payloads for interrupting the agent with a human action request."""
+
+from typing import Optional, TypedDict
+
+
+class HumanInterruptConfig(TypedDict):
+    """Settings for the human interrupt."""
+
+    allow_ignore: bool
+    allow_respond: bool
+    allow_edit: bool
+    allow_accept: bool
+
+
+class ActionRequest(TypedDict):
+    """Action request from the agent."""
+
+    action: str
+    args: dict
+
+
+class HumanInterrupt(TypedDict):
+    """Interrupt the agent with a human action request."""
+
+    action_request: ActionRequest
+    config: HumanInterruptConfig
+    description: Optional[str]
@@ -1,99 +1,69 @@
+import copy
+import json
 import logging
 import os
+import threading
 from functools import lru_cache
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+import httpx
+from cachetools import TTLCache
 from langchain_core.tools import StructuredTool
 from langgraph.config import get_config
 from langgraph.types import interrupt
-from oxp import Oxp
+from oxp import AsyncOxp, DefaultAsyncHttpxClient, DefaultHttpxClient, Oxp
 from oxp._exceptions import APIStatusError, OxpError
 from oxp.types.tool_call_params import Request
 from oxp.types.tool_call_response import ToolCallResponse
 from oxp.types.tool_list_response import Item, ToolListResponse
 
+from react_agent.constants import CACHEABLE_TOOLS, SERVICE_METHODS
+from react_agent.interrupts import HumanInterrupt, HumanInterruptConfig
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Tool dictionaries by service
-service_methods = {
-    "x": [
-        "X_DeleteTweetById",
-        "X_LookupSingleUserByUsername",
-        "X_LookupTweetById",
-        "X_PostTweet",
-        "X_SearchRecentTweetsByKeywords",
-        "X_SearchRecentTweetsByUsername",
-    ],
-    "github": [
-        "Github_CountStargazers",
-        "Github_CreateIssue",
-        "Github_CreateIssueComment",
-        "Github_CreateReplyForReviewComment",
-        "Github_CreateReviewComment",
-        "Github_GetPullRequest",
-        "Github_GetRepository",
-        "Github_ListOrgRepositories",
-        "Github_ListPullRequestCommits",
-        "Github_ListPullRequests",
-        "Github_ListRepositoryActivities",
-        "Github_ListReviewCommentsInARepository",
-        "Github_ListReviewCommentsOnPullRequest",
-        "Github_ListStargazers",
-        "Github_SetStarred",
-        "Github_UpdatePullRequest",
-    ],
-    "gmail": [
-        "Google_ListDraftEmails",
-        "Google_ListEmails",
-        "Google_ReplyToEmail",
-        "Google_SendEmail",
-        "Google_SendDraftEmail",
-        "Google_WriteDraftEmail",
-        "Google_WriteDraftReplyEmail",
-        "Google_SearchContactsByEmail",
-        "Google_SearchContactsByName",
-    ],
-    "google": [
-        "Google_ChangeEmailLabels",
-        "Google_CreateContact",
-        "Google_CreateLabel",
-        "Google_DeleteDraftEmail",
-        "Google_GetThread",
-        "Google_ListEmailsByHeader",
-        "Google_ListLabels",
-        "Google_ListThreads",
-        "Google_SearchContactsByEmail",
-        "Google_SearchContactsByName",
-        "Google_SearchThreads",
-        "Google_TrashEmail",
-        "Google_UpdateDraftEmail",
-    ],
-    "gcal": [
-        "Google_SearchContactsByEmail",
-        "Google_SearchContactsByName",
-        "Google_CreateEvent",
-        "Google_ListEvents",
-        "Google_UpdateEvent",
-        "Google_DeleteEvent",
-    ],
-    "linkedin": ["Linkedin_CreateTextPost"],
-    "search": [
-        "Search_SearchGoogle",
-    ],
-    "hotels": ["Search_SearchHotels"],
-    "flights": [
-        "Search_SearchOneWayFlights",
-        "Search_SearchRoundTripFlights",
-    ],
-    "stocks": ["Search_StockSummary", "Search_StockHistoricalData"],
-    "codesandbox": ["CodeSandbox_RunCode"],
+# Connection pool settings for the OXP HTTP client. Connections are kept alive
+# between tool calls so a ReAct loop doesn't pay a TCP/TLS handshake per call.
+OXP_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=60
+)
+OXP_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# The auth interrupt only lets the user accept, once they've authorized
+_AUTH_INTERRUPT_CONFIG: HumanInterruptConfig = {
+    "allow_ignore": False,
+    "allow_respond": False,
+    "allow_edit": False,
+    "allow_accept": True,
 }
 
+# Short-lived cache of read-only tool results, keyed by (tool, user, input).
+# Entries are copied in and out so callers can't mutate a shared result.
+# Guarded by a lock since sync tools run in worker threads.
+_TOOL_RESULT_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_TOOL_RESULT_CACHE_LOCK = threading.Lock()
+# Per-user count of invalidations. A read only caches its result if no write
+# finished while it was running, since tool calls in a turn run concurrently.
+_TOOL_RESULT_CACHE_GENERATIONS: Dict[str, int] = {}
+_MISSING = object()
+
+
+def _get_client_options() -> Dict[str, Any]:
+    """Get the OXP client options from the environment."""
+    # Note: The Oxp client looks for OXP_API_KEY by default
+    # If you're using OXP_BEARER_TOKEN, set it explicitly
+    bearer_token = os.environ.get("OXP_BEARER_TOKEN") or os.environ.get("OXP_API_KEY")
+    base_url = os.environ.get("OXP_BASE_URL")
+    return {"bearer_token": bearer_token, "base_url": base_url}
 
+
+@lru_cache(maxsize=1)
 def get_oxp_client() -> Oxp:
     """Get an initialized OXP client instance.
 
+    The client is created and health-checked once, then shared.
+
     Returns:
         An initialized Oxp client
 
@@ -101,16 +71,11 @@ def get_oxp_client() -> Oxp:
         OxpError: If required credentials are missing
     """
     try:
-        # Note: The Oxp client looks for OXP_API_KEY by default
-        # If you're using OXP_BEARER_TOKEN, set it explicitly
-        bearer_token = os.environ.get("OXP_BEARER_TOKEN") or os.environ.get(
-            "OXP_API_KEY"
-        )
-        base_url = os.environ.get("OXP_BASE_URL")
-
         client = Oxp(
-            bearer_token=bearer_token,
-            base_url=base_url,
+            **_get_client_options(),
+            http_client=DefaultHttpxClient(
+                limits=OXP_HTTP_LIMITS, timeout=OXP_HTTP_TIMEOUT
+            ),
         )
 
         # Perform a health check to verify connectivity
@@ -121,6 +86,30 @@ def get_oxp_client() -> Oxp:
         raise
 
 
+@lru_cache(maxsize=1)
+def get_async_oxp_client() -> AsyncOxp:
+    """Get an initialized async OXP client instance.
+
+    Connectivity is verified by the health check in `get_oxp_client`.
+
+    Returns:
+        An initialized AsyncOxp client
+
+    Raises:
+        OxpError: If required credentials are missing
+    """
+    try:
+        return AsyncOxp(
+            **_get_client_options(),
+            http_client=DefaultAsyncHttpxClient(
+                limits=OXP_HTTP_LIMITS, timeout=OXP_HTTP_TIMEOUT
+            ),
+        )
+    except OxpError as e:
+        logger.error(f"Failed to initialize async OXP client: {str(e)}")
+        raise
+
+
 @lru_cache(maxsize=1)
 def _get_available_tools() -> tuple[List[str], Dict[str, Item]]:
     """Get available tools from the OXP client with caching.
@@ -140,46 +129,189 @@ def _get_available_tools() -> tuple[List[str], Dict[str, Item]]:
         raise
 
 
-def _handle_authorization_error(error_body: Dict[str, Any], user_id: str) -> None:
+def _handle_authorization_error(error_body: object, user_id: str) -> None:
     """Handle authorization-related errors.
 
     Args:
         error_body: The error body from the API
         user_id: The ID of the user making the request
     """
-    if "missing_requirements" not in error_body:
+    # The body is the raw response text (or None) when it isn't JSON
+    if not isinstance(error_body, dict):
         return
 
-    missing_req = error_body["missing_requirements"]
-    if "authorization" not in missing_req:
+    missing_req = error_body.get("missing_requirements")
+    if not isinstance(missing_req, dict):
         return
 
-    authorization = missing_req["authorization"]
-    if not authorization or len(authorization) != 1:
+    # Only a single pending authorization can be handled
+    authorization = missing_req.get("authorization")
+    if not isinstance(authorization, list) or len(authorization) != 1:
         return
 
     auth = authorization[0]
-    if "authorization_url" not in auth:
+    url = auth.get("authorization_url") if isinstance(auth, dict) else None
+    if not url:
         return
 
     logger.info(f"Authorization required for user {user_id}, initiating auth flow")
-    interrupt(
-        [
-            {
-                "action_request": {
-                    "action": "Auth",
-                    "args": {"url": auth["authorization_url"]},
-                },
-                "config": {
-                    "allow_ignore": False,
-                    "allow_respond": False,
-                    "allow_edit": False,
-                    "allow_accept": True,
-                },
-                "description": None,
-            }
-        ]
-    )
+    request: HumanInterrupt = {
+        "action_request": {
+            "action": "Auth",
+            "args": {"url": url},
+        },
+        "config": _AUTH_INTERRUPT_CONFIG,
+        "description": None,
+    }
+    interrupt([request])
+
+
+def _prepare_request(tool_id: str, kwargs: Dict[str, Any]) -> Request:
+    """Build the OXP request for a tool call in the current run.
+
+    Args:
+        tool_id: The ID of the tool to call
+        kwargs: The tool input
+
+    Returns:
+        The request to send to the OXP client
+    """
+    config = get_config()
+    user_id = config["configurable"].get("langgraph_auth_user_id")
+
+    if not user_id:
+        logger.error("Missing langgraph_auth_user_id in configuration")
+        raise ValueError("Missing langgraph_auth_user_id in configuration")
+
+    logger.debug(f"Calling tool {tool_id} for user {user_id} with args: {kwargs}")
+
+    # Prepare the request according to the Oxp client's expectations
+    return {
+        "tool_id": tool_id,
+        "context": {
+            "user_id": user_id,
+        },
+        "input": kwargs,
+    }
+
+
+def _get_cache_key(request: Request) -> Optional[tuple[str, str, str]]:
+    """Get the result cache key for a request.
+
+    Args:
+        request: The request for the tool call
+
+    Returns:
+        The cache key, or None if the call shouldn't be cached
+    """
+    if request["tool_id"] not in CACHEABLE_TOOLS:
+        return None
+
+    try:
+        input_key = json.dumps(request["input"], sort_keys=True)
+    except TypeError:
+        return None
+
+    return request["tool_id"], request["context"]["user_id"], input_key
+
+
+def _get_cached_result(request: Request) -> tuple[Any, int]:
+    """Look up the cached result for a request as its call starts.
+
+    Args:
+        request: The request for the tool call
+
+    Returns:
+        A copy of the cached result (or _MISSING), and the user's cache
+        generation to pass to `_get_call_result`
+    """
+    key = _get_cache_key(request)
+    user_id = request["context"]["user_id"]
+
+    with _TOOL_RESULT_CACHE_LOCK:
+        generation = _TOOL_RESULT_CACHE_GENERATIONS.get(user_id, 0)
+        value = _MISSING if key is None else _TOOL_RESULT_CACHE.get(key, _MISSING)
+
+    if value is _MISSING:
+        return value, generation
+
+    logger.debug(f"Cache hit for tool {request['tool_id']} for user {user_id}")
+    return copy.deepcopy(value), generation
+
+
+def _invalidate_cached_results(request: Request) -> None:
+    """Drop the user's cached results if the request may have changed them.
+
+    Only tools in CACHEABLE_TOOLS are known to be read-only, so any other
+    tool call invalidates everything cached for that user.
+    """
+    if request["tool_id"] in CACHEABLE_TOOLS:
+        return
+
+    user_id = request["context"]["user_id"]
+    with _TOOL_RESULT_CACHE_LOCK:
+        _TOOL_RESULT_CACHE_GENERATIONS[user_id] = (
+            _TOOL_RESULT_CACHE_GENERATIONS.get(user_id, 0) + 1
+        )
+        for key in [key for key in _TOOL_RESULT_CACHE if key[1] == user_id]:
+            _TOOL_RESULT_CACHE.pop(key, None)
+
+
+def _get_response_value(tool_id: str, response: ToolCallResponse) -> Any:
+    """Return the value of a tool call response, raising if it failed."""
+    if not response.success:
+        error_msg = response.error or "Unknown error occurred"
+        logger.error(f"Tool call failed: {error_msg}")
+        raise ValueError(f"Tool call to {tool_id} failed: {error_msg}")
+
+    return response.value
+
+
+def _get_call_result(
+    request: Request, response: ToolCallResponse, generation: int
+) -> Any:
+    """Return the value of a tool call response and update the result cache.
+
+    Args:
+        request: The request sent to the OXP client
+        response: The response from the OXP client
+        generation: The user's cache generation when the call started
+
+    Returns:
+        The value returned by the tool
+    """
+    _invalidate_cached_results(request)
+    value = _get_response_value(request["tool_id"], response)
+
+    key = _get_cache_key(request)
+    if key is not None:
+        user_id = request["context"]["user_id"]
+        with _TOOL_RESULT_CACHE_LOCK:
+            # Skip results that may predate a write that ran concurrently
+            if _TOOL_RESULT_CACHE_GENERATIONS.get(user_id, 0) == generation:
+                _TOOL_RESULT_CACHE[key] = copy.deepcopy(value)
+
+    return value
+
+
+def _handle_call_error(request: Request, e: Exception) -> None:
+    """Log a failed tool call and start an auth flow if needed.
+
+    Args:
+        request: The request sent to the OXP client
+        e: The error raised by the OXP client
+    """
+    # A failed call may still have changed something
+    _invalidate_cached_results(request)
+    tool_id = request["tool_id"]
+
+    if isinstance(e, APIStatusError):
+        logger.error(f"API error calling tool {tool_id}: {str(e)}")
+        if hasattr(e, "body"):
+            _handle_authorization_error(e.body, request["context"]["user_id"])
+    else:
+        # Handle unexpected errors
+        logger.exception(f"Unexpected error calling tool {tool_id}: {str(e)}")
 
 
 def create_tool_caller(tool_id: str) -> Callable[..., Any]:
@@ -191,99 +323,145 @@ def create_tool_caller(tool_id: str) -> Callable[..., Any]:
     Returns:
         A callable function that will execute the tool with the given parameters
     """
-    # We don't create a client here to avoid creating multiple clients
-    # The client will be obtained when the tool is called
+    # Bound once, so each call doesn't walk client.tools
+    call = get_oxp_client().tools.call
 
     def call_tool(**kwargs: Any) -> Any:
         """Call a tool with the given parameters."""
-        client = get_oxp_client()
-        config = get_config()
-        user_id = config["configurable"].get("langgraph_auth_user_id")
-
-        if not user_id:
-            logger.error("Missing langgraph_auth_user_id in configuration")
-            raise ValueError("Missing langgraph_auth_user_id in configuration")
-
-        logger.debug(f"Calling tool {tool_id} for user {user_id} with args: {kwargs}")
-
-        # Prepare the request according to the Oxp client's expectations
-        request: Request = {
-            "tool_id": tool_id,
-            "context": {
-                "user_id": user_id,
-            },
-            "input": kwargs,
-        }
+        request = _prepare_request(tool_id, kwargs)
+        value, generation = _get_cached_result(request)
+        if value is not _MISSING:
+            return value
 
         try:
-            # Call the tool using the client's built-in method
-            response: ToolCallResponse = client.tools.call(request=request)
-
-            # Check for successful response
-            if not response.success:
-                error_msg = response.error or "Unknown error occurred"
-                logger.error(f"Tool call failed: {error_msg}")
-                raise ValueError(f"Tool call to {tool_id} failed: {error_msg}")
-
-            return response.value
-
-        except APIStatusError as e:
-            # Handle other API errors
-            logger.error(f"API error calling tool {tool_id}: {str(e)}")
-            if hasattr(e, "body"):
-                _handle_authorization_error(e.body, user_id)
-            raise
-
+            response: ToolCallResponse = call(request=request)
         except Exception as e:
-            # Handle unexpected errors
-            logger.exception(f"Unexpected error calling tool {tool_id}: {str(e)}")
+            _handle_call_error(request, e)
             raise
 
+        return _get_call_result(request, response, generation)
+
     return call_tool
 
 
-def get_tools(tool_types: Optional[List[str]] = None) -> List[StructuredTool]:
-    """Get structured tools, optionally filtered by tool type.
+def create_async_tool_caller(tool_id: str) -> Callable[..., Awaitable[Any]]:
+    """Create an async tool caller for the specified tool.
+
+    Lets the ToolNode run several tool calls from one model turn concurrently.
 
     Args:
-        tool_types: List of tool types to include (e.g., "x", "github")
+        tool_id: The ID of the tool to call
 
     Returns:
-        List of structured tools
+        A coroutine function that will execute the tool with the given parameters
     """
-    tool_ids, available_tools_by_name = _get_available_tools()
+    # Bound once, so each call doesn't walk client.tools
+    acall = get_async_oxp_client().tools.call
 
-    # Filter tool_ids by tool_types if specified
-    if tool_types:
-        allowed_tool_names = set()
-        for t_type in tool_types:
-            if t_type in service_methods:
-                allowed_tool_names.update(service_methods[t_type])
-            else:
-                logger.warning(f"Unknown tool type: {t_type}")
+    async def acall_tool(**kwargs: Any) -> Any:
+        """Call a tool with the given parameters."""
+        request = _prepare_request(tool_id, kwargs)
+        value, generation = _get_cached_result(request)
+        if value is not _MISSING:
+            return value
 
-        tool_ids = [t_id for t_id in tool_ids if t_id in allowed_tool_names]
+        try:
+            response: ToolCallResponse = await acall(request=request)
+        except Exception as e:
+            _handle_call_error(request, e)
+            raise
 
-        if not tool_ids:
-            logger.warning(f"No tools found for the specified types: {tool_types}")
+        return _get_call_result(request, response, generation)
 
-    tools = []
-    for tool_id in tool_ids:
-        if tool_id not in available_tools_by_name:
-            logger.warning(f"Tool {tool_id} not found in available tools")
-            continue
+    return acall_tool
 
+
+@lru_cache(maxsize=1)
+def _get_structured_tools() -> Dict[str, StructuredTool]:
+    """Build a structured tool for every available tool, once.
+
+    Returns:
+        A dict of tool ID to structured tool
+    """
+    tool_ids, available_tools_by_name = _get_available_tools()
+
+    tools = {}
+    for tool_id in tool_ids:
         tool = available_tools_by_name[tool_id]
         try:
-            tools.append(
-                StructuredTool(
-                    name=tool.name,
-                    description=tool.description,
-                    args_schema=tool.input_schema,
-                    func=create_tool_caller(tool_id),
-                )
+            tools[tool_id] = StructuredTool(
+                name=tool.name,
+                description=tool.description,
+                args_schema=tool.input_schema,
+                func=create_tool_caller(tool_id),
+                coroutine=create_async_tool_caller(tool_id),
             )
         except Exception as e:
             logger.error(f"Failed to create tool for {tool_id}: {str(e)}")
 
     return tools
+
+
+@lru_cache(maxsize=1)
+def _get_tools_by_type() -> Dict[str, tuple[StructuredTool, ...]]:
+    """Map each tool type to its available structured tools.
+
+    Returns:
+        A dict of tool type to the structured tools for that type
+    """
+    structured_tools = _get_structured_tools()
+    # Follow the OXP listing order, so the tools (and the prompt built from
+    # them) are stable across processes
+    return {
+        t_type: tuple(
+            tool for tool_id, tool in structured_tools.items() if tool_id in names
+        )
+        for t_type, names in SERVICE_METHODS.items()
+    }
+
+
+@lru_cache(maxsize=64)
+def _get_tools_for_types(tool_types: frozenset[str]) -> tuple[StructuredTool, ...]:
+    """Get the structured tools for a set of tool types, with caching.
+
+    Args:
+        tool_types: Tool types to include, or an empty set for all tools
+
+    Returns:
+        A tuple of structured tools
+    """
+    if not tool_types:
+        return tuple(_get_structured_tools().values())
+
+    tools_by_type = _get_tools_by_type()
+    # Tools shared between services (e.g. Google_SearchContactsByEmail) are
+    # only included once
+    seen: set[str] = set()
+    tools: List[StructuredTool] = []
+    # Sorted so the tool order doesn't depend on set iteration order
+    for t_type in sorted(tool_types):
+        if t_type not in tools_by_type:
+            logger.warning(f"Unknown tool type: {t_type}")
+            continue
+
+        for tool in tools_by_type[t_type]:
+            if tool.name not in seen:
+                seen.add(tool.name)
+                tools.append(tool)
+
+    if not tools:
+        logger.warning(f"No tools found for the specified types: {sorted(tool_types)}")
+
+    return tuple(tools)
+
+
+def get_tools(tool_types: Optional[List[str]] = None) -> List[StructuredTool]:
+    """Get structured tools, optionally filtered by tool type.
+
+    Args:
+        tool_types: List of tool types to include (e.g., "x", "github")
+
+    Returns:
+        List of structured tools
+    """
+    return list(_get_tools_for_types(frozenset(tool_types or ())))
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import typing
+from datetime import datetime, timezone
 from functools import lru_cache
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
 
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
@@ -13,13 +16,17 @@ from langchain_core.messages import BaseMessage
 def get_message_text(msg: BaseMessage) -> str:
     """Get the text content of a message."""
     content = msg.content
-    if isinstance(content, str):
+    content_type = type(content)
+    if content_type is str:
         return content
-    elif isinstance(content, dict):
+    elif content_type is dict:
         return content.get("text", "")
+    elif all(type(c) is str for c in content):
+        return "".join(content).strip()
     else:
-        txts = [c if isinstance(c, str) else (c.get("text") or "") for c in content]
-        return "".join(txts).strip()
+        return "".join(
+            c if type(c) is str else (c.get("text") or "") for c in content
+        ).strip()
 
 
 @lru_cache(maxsize=12)
@@ -33,31 +40,41 @@ def load_chat_model(fully_specified_name: str) -> BaseChatModel:
     return init_chat_model(model, model_provider=provider)
 
 
-class State:
+class State(SimpleNamespace):
     """An object that can be used to store arbitrary state."""
 
-    _state: dict[str, typing.Any]
-
     def __init__(self, state: dict[str, typing.Any] | None = None):
-        if state is None:
-            state = {}
-        super().__setattr__("_state", state)
+        super().__init__(**(state or {}))
+
+    def as_dict(self) -> dict[str, typing.Any]:
+        """Return the state as a dict."""
+        return vars(self)
 
-    def __setattr__(self, key: typing.Any, value: typing.Any) -> None:
-        self._state[key] = value
 
-    def __getattr__(self, key: typing.Any) -> typing.Any:
-        try:
-            return self._state[key]
-        except KeyError:
-            message = "'{}' object has no attribute '{}'"
-            raise AttributeError(message.format(self.__class__.__name__, key))
+# (label, IANA zone) pairs reported to the LLM, in display order
+TIME_ZONES = [
+    ("UTC", "UTC"),
+    ("Eastern Time (ET)", "America/New_York"),
+    ("Central Time (CT)", "America/Chicago"),
+    ("Mountain Time (MT)", "America/Denver"),
+    ("Pacific Time (PT)", "America/Los_Angeles"),
+    ("GMT", "Etc/GMT"),
+    ("Central European Time (CET)", "Europe/Berlin"),
+    ("Japan Standard Time (JST)", "Asia/Tokyo"),
+    ("Australian Eastern Time (AET)", "Australia/Sydney"),
+]
 
-    def __delattr__(self, key: typing.Any) -> None:
-        del self._state[key]
+_ZONE_INFOS = [(label, ZoneInfo(name)) for label, name in TIME_ZONES]
 
 
-from datetime import datetime, timedelta, timezone
+@lru_cache(maxsize=4)
+def _format_times(minute: int) -> str:
+    """Format the times in each zone for the given minute since the epoch."""
+    utc_now = datetime.fromtimestamp(minute * 60, timezone.utc)
+    return "\n".join(
+        f"{label}: {utc_now.astimezone(zone):%Y-%m-%d %H:%M}"
+        for label, zone in _ZONE_INFOS
+    )
 
 
 def get_formatted_times(user_timezone: str | None = None) -> str:
@@ -65,55 +82,7 @@ def get_formatted_times(user_timezone: str | None = None) -> str:
 
     This helps the LLM provide accurate time-based information regardless of user location.
     Includes UTC, Eastern Time (ET), Central Time (CT), Pacific Time (PT), and GMT.
+    Times are given to the minute, so calls within the same minute share a string.
     """
-    # Get current UTC time
-    utc_now = datetime.now(timezone.utc)
-
-    # Define major time zone offsets (hours from UTC)
-    time_zones = {
-        "UTC": 0,
-        "Eastern Time (ET)": -5,  # EST is UTC-5, EDT is UTC-4
-        "Central Time (CT)": -6,  # CST is UTC-6, CDT is UTC-5
-        "Mountain Time (MT)": -7,  # MST is UTC-7, MDT is UTC-6
-        "Pacific Time (PT)": -8,  # PST is UTC-8, PDT is UTC-7
-        "GMT": 0,
-        "Central European Time (CET)": 1,  # CET is UTC+1, CEST is UTC+2
-        "Japan Standard Time (JST)": 9,  # UTC+9
-        "Australian Eastern Time (AET)": 10,  # AEST is UTC+10, AEDT is UTC+11
-    }
-
-    # Simple DST adjustment (March-November for US time zones)
-    # This is a simplified approach and doesn't account for exact DST transition dates
-    is_dst_us = 3 <= utc_now.month <= 11
-    is_dst_eu = 3 <= utc_now.month <= 10
-    is_dst_au = utc_now.month <= 4 or utc_now.month >= 10  # Southern hemisphere DST
-
-    # Apply DST adjustments
-    if is_dst_us:
-        time_zones["Eastern Time (ET)"] += 1
-        time_zones["Central Time (CT)"] += 1
-        time_zones["Mountain Time (MT)"] += 1
-        time_zones["Pacific Time (PT)"] += 1
-
-    if is_dst_eu:
-        time_zones["Central European Time (CET)"] += 1
-
-    if is_dst_au:
-        time_zones["Australian Eastern Time (AET)"] += 1
-
-    # Format the time string
-    time_strings = []
-    date_format = "%Y-%m-%d"
-    time_format = "%H:%M:%S"
-
-    for zone_name, offset in time_zones.items():
-        zone_time = utc_now.replace(tzinfo=timezone(timedelta(hours=offset)))
-        time_strings.append(
-            f"{zone_name}: {zone_time.strftime(f'{date_format} {time_format}')}"
-        )
-
     # TODO: Add user timezone to the time strings
-    # if user_timezone:
-    #    time_strings.append(f"User timezone: {user_timezone}")
-
-    return "\n".join(time_strings)
+    return _format_times(int(datetime.now(timezone.utc).timestamp() // 60))